@@ -5,13 +5,25 @@ geospatial prospectivity heatmap using H3 indexing. See individual modules
 for details.
 """
 
-# Import everything from submodules
-from .config import settings
-from .geospatial import add_distance_columns, build_grid, h3_to_geodataframe, polys_to_h3
-from .ingest import add_lithology_flags, extract_rock_types
-from .score import compute_likelihood
-from .utils import df_more_info
-from .viz import build_static_map
+import importlib
+
+# Map each public name to the submodule that defines it. Submodules are
+# imported on first attribute access (PEP 562), so importing the package
+# (e.g. for `prospectivity --help`) doesn't load geopandas, matplotlib etc.
+_EXPORTS = {
+    "settings": "config",
+    "add_distance_columns": "geospatial",
+    "polys_to_h3": "geospatial",
+    "build_grid": "geospatial",
+    "h3_to_geodataframe": "geospatial",
+    "load_bedrock": "ingest",
+    "extract_rock_types": "ingest",
+    "add_lithology_flags": "ingest",
+    "compute_likelihood": "score",
+    "write_parquet": "persist",
+    "build_static_map": "viz",
+    "df_more_info": "utils",
+}
 
 # Define what gets imported when using `from prospectivity_tools import *`
 __all__ = [
@@ -20,9 +32,24 @@ __all__ = [
     "polys_to_h3",
     "build_grid",
     "h3_to_geodataframe",
+    "load_bedrock",
     "extract_rock_types",
     "add_lithology_flags",
     "compute_likelihood",
+    "write_parquet",
     "build_static_map",
     "df_more_info",
 ]
+
+
+def __getattr__(name: str):
+    """Import the submodule defining ``name`` on first access and cache it."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,13 +4,6 @@ import sys
 from pathlib import Path
 
 import click
-import geopandas as gpd
-
-from . import settings
-from .geospatial import add_distance_columns, build_grid, h3_to_geodataframe
-from .ingest import add_lithology_flags, extract_rock_types
-from .score import compute_likelihood
-from .viz import build_static_map
 
 
 @click.command()
@@ -19,13 +12,18 @@ from .viz import build_static_map
     default=True,
     help="Generate static map visualization (default: True)",
 )
+@click.option(
+    "--gpkg/--no-gpkg",
+    default=False,
+    help="Also write results as a GeoPackage for legacy consumers (default: False)",
+)
 @click.option(
     "--config",
     type=click.Path(exists=True),
     default="config.yaml",
     help="Path to configuration file (default: config.yaml)",
 )
-def main(generate_map: bool, config: str):
+def main(generate_map: bool, gpkg: bool, config: str):
     """Generate a prospectivity heatmap from bedrock geology data.
 
     This tool processes bedrock geology polygons to create a prospectivity
@@ -36,9 +34,17 @@ def main(generate_map: bool, config: str):
     3. Builds an H3 hexagonal grid
     4. Computes distances to rock type boundaries
     5. Calculates likelihood scores using a Gaussian kernel
-    6. Saves results as a geopackage
+    6. Saves results as GeoParquet (and optionally a geopackage)
     7. Optionally generates a static map visualization
     """
+    # Imported here so `--help` doesn't pay for geopandas/matplotlib
+    from . import settings
+    from .geospatial import add_distance_columns, build_grid, h3_to_geodataframe
+    from .ingest import add_lithology_flags, extract_rock_types, load_bedrock
+    from .persist import write_parquet
+    from .score import compute_likelihood
+    from .viz import build_static_map
+
     try:
         # Validate input file exists
         input_path = Path(settings.paths["input_gpkg"])
@@ -46,12 +52,20 @@ def main(generate_map: bool, config: str):
             click.echo(f"Error: Input file not found: {input_path}", err=True)
             sys.exit(1)
 
+        # Resolve the output path before doing any work. Configs written
+        # before GeoParquet output have no output_parquet entry; those write
+        # next to the GeoPackage path instead.
+        if "output_parquet" in settings.paths:
+            output_path = Path(settings.paths["output_parquet"])
+        else:
+            output_path = Path(settings.paths["output_gpkg"]).with_suffix(".parquet")
+
         click.echo("Starting prospectivity analysis...")
 
         # Read in geopackage
         click.echo(f"Reading bedrock data from {input_path}")
-        gdf = gpd.read_file(settings.paths["input_gpkg"], engine="pyogrio").to_crs(settings.crs)
-        click.echo(f"Loaded {len(gdf)} polygons")
+        gdf = load_bedrock(input_path)
+        click.echo(f"Loaded {len(gdf)} candidate polygons")
 
         # Feature engineering: add lithology flags
         click.echo("Adding lithology flags...")
@@ -78,15 +92,20 @@ def main(generate_map: bool, config: str):
         click.echo("Calculating likelihood scores...")
         scored = compute_likelihood(grid)
 
-        # Convert to GeoDataFrame for saving as geopackage
+        # Convert to GeoDataFrame for saving
         click.echo("Converting to GeoDataFrame...")
         scored_gdf = h3_to_geodataframe(scored)
 
-        # Save the scored grid as a geopackage
-        output_path = Path(settings.paths["output_gpkg"])
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Save the scored grid as GeoParquet
         click.echo(f"Saving results to {output_path}")
-        scored_gdf.to_file(output_path, driver="GPKG")
+        write_parquet(scored_gdf, output_path)
+
+        # Optionally save a geopackage as well (much slower to write)
+        if gpkg:
+            gpkg_path = Path(settings.paths["output_gpkg"])
+            gpkg_path.parent.mkdir(parents=True, exist_ok=True)
+            click.echo(f"Saving GeoPackage to {gpkg_path}")
+            scored_gdf.to_file(gpkg_path, driver="GPKG")
 
         # Create a static map if requested
         if generate_map:
@@ -0,0 +1,27 @@
+"""Bit flags packed into the grid's ``flags`` column.
+
+Kept in their own lightweight module so that consumers such as
+:mod:`.score` can decode the column without importing the geospatial
+stack.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Whether a cell intersects rock type A and/or B
+INTERSECTS_A = 1
+INTERSECTS_B = 2
+
+
+def packed_flags(grid: pd.DataFrame) -> np.ndarray:
+    """Return a grid's ``uint8`` flags, accepting either grid schema.
+
+    Grids from :func:`.geospatial.build_grid` carry a packed ``flags``
+    column. Grids in the older schema, with boolean ``intersects_a`` and
+    ``intersects_b`` columns, are packed here.
+    """
+    if "flags" in grid:
+        return grid["flags"].to_numpy()
+    flags = np.where(grid["intersects_a"].to_numpy(dtype=bool), INTERSECTS_A, 0)
+    flags |= np.where(grid["intersects_b"].to_numpy(dtype=bool), INTERSECTS_B, 0)
+    return flags.astype(np.uint8)
@@ -1,59 +1,158 @@
 from __future__ import annotations
 
+import hashlib
 import math
-from collections import deque
+from itertools import chain
 from pathlib import Path
 
 import geopandas as gpd
 import h3
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
+from h3.api import basic_int as h3_int
+from pyproj import Transformer
+from shapely.geometry import Polygon, box
 
 from .config import settings
+from .flags import INTERSECTS_A, INTERSECTS_B, packed_flags
+from .persist import ROW_GROUP_SIZE
 
 CACHE_DIR = Path("__cache__")
 
+# h3 polyfill tests every candidate cell in a polygon's bounding box against
+# every vertex, so a few large, detailed polygons can dominate the polyfill
+# time. Polygons whose (bbox cells x vertices) exceeds this are split first.
+MAX_POLYFILL_WORK = 10_000_000
 
-def polys_to_h3(gdf: gpd.GeoDataFrame, tag: str) -> pd.Series:
-    """Return unique H3 cells intersecting the given polygons.
+# Offsets of a cell's six edge neighbours in H3 local IJ coordinates
+IJ_NEIGHBOUR_OFFSETS = np.array([[1, 0], [-1, 0], [0, 1], [0, -1], [1, 1], [-1, -1]])
 
-    Results are cached per ``tag`` in ``__cache__/`` so reruns with a
-    fixed resolution are instantaneous.
+# Centre-to-centre distance in metres between neighbouring cells, per resolution
+STEP_M = {res: h3.edge_length(res, "m") * math.sqrt(3) for res in range(16)}
+
+
+def geometry_digest(gdf: gpd.GeoDataFrame) -> str:
+    """Return a short content hash of the geometries and CRS of ``gdf``."""
+    h = hashlib.blake2b(digest_size=8)
+    h.update(str(gdf.crs).encode())
+    for wkb in gdf.geometry.to_wkb():
+        h.update(wkb)
+    return h.hexdigest()
+
+
+def to_wgs84(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+    """Return ``gdf`` in WGS84 coordinates, reprojecting only if needed.
+
+    H3 indexes WGS84 longitude/latitude. Inputs already in WGS84 are
+    returned unchanged; everything else, including geographic CRSs on
+    other datums such as NAD27 or NAD83, is reprojected.
+    """
+    if gdf.crs.equals("EPSG:4326"):
+        return gdf
+    return gdf.to_crs("EPSG:4326")
+
+
+def grid_digest(grid: pd.DataFrame) -> str:
+    """Return a short content hash of a grid's cells and intersection flags."""
+    columns = pd.DataFrame({"h3_id": grid["h3_id"].to_numpy(), "flags": packed_flags(grid)})
+    rows = pd.util.hash_pandas_object(columns, index=False)
+    return hashlib.blake2b(rows.to_numpy().tobytes(), digest_size=8).hexdigest()
+
+
+def write_cache(df: pd.DataFrame, path: Path) -> None:
+    """Write a cache table to Parquet with zstd compression."""
+    df.to_parquet(path, index=False, compression="zstd", row_group_size=ROW_GROUP_SIZE)
+
+
+def read_cache(path: Path, columns: list[str]) -> dict[str, np.ndarray]:
+    """Read cache columns from Parquet as NumPy arrays.
+
+    The file is memory-mapped and only ``columns`` are decoded. Null-free
+    numeric columns convert to NumPy without another copy, so the arrays
+    may be read-only views onto Arrow memory.
+    """
+    table = pq.read_table(path, columns=columns, memory_map=True)
+    return {name: table.column(name).to_numpy() for name in columns}
+
+
+def polyfill_work(poly: Polygon, res: int) -> float:
+    """Estimate polyfill cost as bounding-box cells times exterior vertices."""
+    minx, miny, maxx, maxy = poly.bounds
+    width_km = (maxx - minx) * 111.32 * math.cos(math.radians((miny + maxy) / 2))
+    height_km = (maxy - miny) * 110.57
+    bbox_cells = width_km * height_km / h3.hex_area(res, "km^2")
+    return bbox_cells * len(poly.exterior.coords)
+
+
+def subdivide_polygon(
+    poly: Polygon, res: int, max_work: float = MAX_POLYFILL_WORK
+) -> list[Polygon]:
+    """Split a polygon into pieces that are cheap to polyfill at ``res``.
+
+    The polygon is halved along the longer side of its bounding box and
+    each half is split recursively until :func:`polyfill_work` is below
+    ``max_work``. The pieces tile the original polygon.
+    """
+    if polyfill_work(poly, res) <= max_work:
+        return [poly]
+
+    minx, miny, maxx, maxy = poly.bounds
+    if maxx - minx >= maxy - miny:
+        mid = (minx + maxx) / 2
+        halves = [box(minx, miny, mid, maxy), box(mid, miny, maxx, maxy)]
+    else:
+        mid = (miny + maxy) / 2
+        halves = [box(minx, miny, maxx, mid), box(minx, mid, maxx, maxy)]
+
+    pieces = []
+    for half in halves:
+        part = poly.intersection(half)
+        for piece in getattr(part, "geoms", [part]):
+            if piece.geom_type == "Polygon" and not piece.is_empty:
+                pieces.extend(subdivide_polygon(piece, res, max_work))
+    return pieces
+
+
+def polys_to_h3(gdf: gpd.GeoDataFrame, tag: str, res: int | None = None) -> pd.Series:
+    """Return unique H3 cells (as ``uint64``) intersecting the given polygons.
+
+    ``res`` defaults to ``settings.grid["resolution"]``. Results are cached
+    in ``__cache__/`` keyed by ``tag``, resolution and a hash of the input
+    geometries, so reruns on the same polygons are instantaneous and a
+    changed input never picks up a stale cache.
     """
+    if res is None:
+        res = settings.grid["resolution"]
     CACHE_DIR.mkdir(exist_ok=True)
-    res = settings.grid["resolution"]
-    cache_file = CACHE_DIR / f"{tag}_r{res}.feather"
+    cache_file = CACHE_DIR / f"{tag}_r{res}_u64_{geometry_digest(gdf)}.parquet"
     if cache_file.exists():
-        return pd.read_feather(cache_file)["h3_id"]
+        return pd.Series(read_cache(cache_file, ["h3_id"])["h3_id"], name="h3_id")
 
     # Convert to WGS84 if not already in geographic coordinates (h3 requirement)
-    if not gdf.crs.is_geographic:
-        gdf_wgs84 = gdf.to_crs("EPSG:4326")  # WGS84
-    else:
-        gdf_wgs84 = gdf
+    gdf_wgs84 = to_wgs84(gdf)
 
-    # Convert polygons to H3 cells using h3.polyfill_geojson
+    # Keep valid geometries, split into their polygon parts
+    geoms = gdf_wgs84.geometry[gdf_wgs84.geometry.is_valid].explode(index_parts=False)
+    polys = geoms[geoms.geom_type == "Polygon"]
+
+    # Convert polygons to H3 cells using h3.polyfill_geojson. Only the
+    # exterior ring is filled; large rings are split into pieces first.
     cell_ids = []
-    for geom in gdf_wgs84.geometry:
-        if geom.is_valid:
-            # Convert shapely geometry to GeoJSON format for h3.polyfill_geojson
-            if geom.geom_type == "Polygon":
-                # Extract exterior coordinates as (lng, lat) tuples for GeoJSON format
-                coords = [
-                    (lng, lat) for lng, lat in geom.exterior.coords
-                ]  # Keep all coordinates including the closing one
-                geojson_poly = {"type": "Polygon", "coordinates": [coords]}
-                cell_ids.extend(h3.polyfill_geojson(geojson_poly, res))
-            elif geom.geom_type == "MultiPolygon":
-                # Handle MultiPolygon geometries
-                for poly in geom.geoms:
-                    coords = [
-                        (lng, lat) for lng, lat in poly.exterior.coords
-                    ]  # Keep all coordinates including the closing one
-                    geojson_poly = {"type": "Polygon", "coordinates": [coords]}
-                    cell_ids.extend(h3.polyfill_geojson(geojson_poly, res))
-
-    series = pd.Series(pd.unique(cell_ids), name="h3_id")
-    series.to_frame().to_feather(cache_file)
+    for poly in polys:
+        if polyfill_work(poly, res) <= MAX_POLYFILL_WORK:
+            rings = [poly.exterior.coords]
+        else:
+            pieces = subdivide_polygon(Polygon(poly.exterior), res)
+            rings = [piece.exterior.coords for piece in pieces]
+
+        for ring in rings:
+            # GeoJSON (lng, lat) order, keeping the closing coordinate
+            geojson_poly = {"type": "Polygon", "coordinates": [list(ring)]}
+            cell_ids.extend(h3_int.polyfill_geojson(geojson_poly, res))
+
+    series = pd.Series(pd.unique(np.array(cell_ids, dtype=np.uint64)), name="h3_id")
+    write_cache(series.to_frame(), cache_file)
     return series
 
 
@@ -71,26 +170,25 @@ def build_grid(rock_a: gpd.GeoDataFrame, rock_b: gpd.GeoDataFrame, bounds=None)
     Returns
     -------
     pandas.DataFrame
-        A DataFrame with columns ``h3_id``, ``intersects_a``, and ``intersects_b``.
-        ``intersects_a`` and ``intersects_b`` are boolean columns indicating
-        whether each hexagon intersects ``rock_a`` and ``rock_b``, respectively.
+        A DataFrame with columns ``h3_id`` (``uint64`` cell indices) and
+        ``flags``, a ``uint8`` bit set in which :data:`INTERSECTS_A` and
+        :data:`INTERSECTS_B` mark hexagons intersecting ``rock_a`` and
+        ``rock_b``, respectively.
     """
-    if bounds is None:
-        # Combine both rock types into a single GeoDataFrame
-        combined = gpd.GeoDataFrame(pd.concat([rock_a, rock_b], ignore_index=True))
-
-        # Convert to WGS84 to get bounds in the right coordinate system
-        if not combined.crs.is_geographic:
-            combined_wgs84 = combined.to_crs("EPSG:4326")
-        else:
-            combined_wgs84 = combined
+    # Reproject each rock type once; both the bounds and the polyfill in
+    # polys_to_h3 work in WGS84
+    rock_a = to_wgs84(rock_a)
+    rock_b = to_wgs84(rock_b)
 
-        # Get bounds in WGS84 [minx, miny, maxx, maxy]
-        bounds = combined_wgs84.total_bounds
+    if bounds is None:
+        # Combined WGS84 bounds [minx, miny, maxx, maxy] of both rock types,
+        # from each frame's own bounds rather than a concatenated copy
+        both = np.vstack([rock_a.total_bounds, rock_b.total_bounds])
+        bounds = np.concatenate([both[:, :2].min(axis=0), both[:, 2:].max(axis=0)])
 
     # Generate hexagons covering the bounding box
     res = settings.grid["resolution"]
-    hexagons = h3.polyfill_geojson(
+    hexagons = h3_int.polyfill_geojson(
         {
             "type": "Polygon",
             "coordinates": [
@@ -106,52 +204,150 @@ def build_grid(rock_a: gpd.GeoDataFrame, rock_b: gpd.GeoDataFrame, bounds=None)
         res,
     )
 
-    # Convert hexagons to a DataFrame
-    all_cells = pd.Series(list(hexagons), name="h3_id", dtype=str)
-
-    # Determine intersection flags
-    a_cells = polys_to_h3(rock_a, "a")
-    b_cells = polys_to_h3(rock_b, "b")
-    grid = pd.DataFrame(
-        {
-            "h3_id": all_cells,
-            "intersects_a": all_cells.isin(a_cells),
-            "intersects_b": all_cells.isin(b_cells),
-        }
+    # Convert hexagons to a uint64 index, sorted by H3 id
+    all_cells = pd.Index(
+        np.sort(np.fromiter(hexagons, dtype=np.uint64, count=len(hexagons))), name="h3_id"
     )
 
+    # Index each rock type's polygons at the grid's resolution
+    rock_cells = [polys_to_h3(rock_a, "a", res), polys_to_h3(rock_b, "b", res)]
+
+    # Set each rock type's bit on the grid cells it covers (-1: not in grid)
+    flags = np.zeros(len(all_cells), dtype=np.uint8)
+    for bit, cells in zip([INTERSECTS_A, INTERSECTS_B], rock_cells, strict=True):
+        positions = all_cells.get_indexer(cells)
+        flags[positions[positions >= 0]] |= bit
+    grid = pd.DataFrame({"h3_id": all_cells, "flags": flags})
+
     return grid
 
 
-def hex_step_distances(sources, allowed_cells=None):
+def _neighbour_rings(cells) -> list[list[int]]:
+    """Return the edge neighbours of each cell (excluding the cell itself)."""
+    return [[nb for nb in h3_int.k_ring(h, 1) if nb != h] for h in cells]
+
+
+def _ij_keys(ij: np.ndarray) -> np.ndarray:
+    """Pack IJ coordinate pairs (along the last axis) into flat int64 keys."""
+    ij = ij.reshape(-1, 2)
+    return (ij[:, 0] << 32) | (ij[:, 1] & 0xFFFFFFFF)
+
+
+def hex_neighbour_table(cells: pd.Index) -> np.ndarray:
+    """Return the row positions of each cell's edge neighbours within ``cells``.
+
+    Parameters
+    ----------
+    cells : pandas.Index
+        ``uint64`` H3 indices making up the grid.
+
+    Returns
+    -------
+    numpy.ndarray
+        Integer array of shape ``(len(cells), 6)``. Row ``i`` holds the
+        positions of the neighbours of ``cells[i]``; neighbours outside the
+        grid (and the missing sixth neighbour of pentagons) are ``-1``.
+    """
+    ids = cells.to_numpy(dtype=np.uint64)
+    table = np.full((len(ids), 6), -1, dtype=np.int64)
+    fallback = np.zeros(len(ids), dtype=bool)
+
+    # Look up neighbours by local IJ offset within each base cell; cells with
+    # a neighbour not found this way, and pentagon base cells, use k_ring below
+    base_cells = (ids >> np.uint64(45)) & np.uint64(0x7F)
+    for base_cell in np.unique(base_cells):
+        rows = np.flatnonzero(base_cells == base_cell)
+        origin = int(ids[rows[0]])
+        if h3_int.h3_is_pentagon(h3_int.h3_to_parent(origin, 0)):
+            fallback[rows] = True
+            continue
+        ij = np.array(
+            [h3_int.experimental_h3_to_local_ij(origin, h) for h in ids[rows].tolist()],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        neighbour_keys = _ij_keys(ij[:, None, :] + IJ_NEIGHBOUR_OFFSETS)
+        positions = pd.Index(_ij_keys(ij)).get_indexer(neighbour_keys).reshape(-1, 6)
+        table[rows] = np.where(positions >= 0, rows[positions], -1)
+        fallback[rows] = (positions < 0).any(axis=1)
+
+    rows = np.flatnonzero(fallback)
+    rings = _neighbour_rings(ids[rows].tolist())
+    counts = np.fromiter(map(len, rings), dtype=np.int64, count=len(rings))
+
+    # Resolve all neighbour ids to row positions in one vectorized lookup
+    # instead of a Python dict lookup per neighbour
+    flat = np.fromiter(chain.from_iterable(rings), dtype=np.uint64, count=counts.sum())
+    positions = cells.get_indexer(flat)
+
+    # Scatter into fixed-width rows (pentagons only have five neighbours)
+    table[rows] = -1
+    cols = np.arange(len(positions)) - np.repeat(np.cumsum(counts) - counts, counts)
+    table[np.repeat(rows, counts), cols] = positions
+    return table
+
+
+def hex_step_distances(neighbours: np.ndarray, sources: np.ndarray) -> np.ndarray:
     """
     Multi-source breadth-first search on the H3 grid.
 
+    The search expands one level at a time over a precomputed neighbour
+    table, so each level is a handful of array operations rather than a
+    ``k_ring`` call per visited cell.
+
     Parameters
     ----------
-    sources : iterable
-        H3 indices where distance = 0
-    allowed_cells : set, optional
-        Set that limits expansion to your grid (useful if clipped beforehand)
+    neighbours : numpy.ndarray
+        Neighbour table as returned by :func:`hex_neighbour_table`.
+    sources : numpy.ndarray
+        Boolean mask of cells where distance = 0
 
     Returns
     -------
-    dict
-        Mapping {cell: steps_from_nearest_source}
+    numpy.ndarray
+        ``int32`` array of steps from the nearest source, ``-1`` where a
+        cell cannot be reached within the grid.
     """
-    allowed = set(allowed_cells) if allowed_cells is not None else None
-    dist = {h: 0 for h in sources}
-    q = deque(sources)
-
-    while q:
-        h = q.popleft()
-        d = dist[h]
-        for nb in h3.k_ring(h, 1):  # neighbours share an edge
-            if allowed and nb not in allowed:  # skip cells outside your grid
-                continue
-            if nb not in dist:  # first time we visit -> shortest
-                dist[nb] = d + 1
-                q.append(nb)
+    steps = np.full(len(neighbours), -1, dtype=np.int32)
+    slot = np.empty(len(neighbours), dtype=np.int64)  # scratch for deduplication
+    frontier = np.flatnonzero(sources)
+    steps[frontier] = 0
+
+    level = 0
+    while frontier.size:
+        level += 1
+        candidates = neighbours[frontier].ravel()
+        candidates = candidates[candidates >= 0]  # skip cells outside the grid
+        candidates = candidates[steps[candidates] < 0]  # first visit -> shortest
+
+        # Keep one occurrence of each cell: the one whose write to `slot` won
+        order = np.arange(candidates.size)
+        slot[candidates] = order
+        frontier = candidates[slot[candidates] == order]
+        steps[frontier] = level
+    return steps
+
+
+def grid_resolution(cells: pd.Index) -> int:
+    """Return the H3 resolution shared by all ``cells``.
+
+    Raises
+    ------
+    ValueError
+        If the cells are not all at the same resolution, since hex steps
+        then have no single length in metres.
+    """
+    # The resolution is stored in bits 52-55 of an H3 cell index
+    ids = np.asarray(cells, dtype=np.uint64)
+    resolutions = np.unique((ids >> np.uint64(52)) & np.uint64(0xF))
+    if len(resolutions) != 1:
+        raise ValueError(f"Grid mixes H3 resolutions: {resolutions.tolist()}")
+    return int(resolutions[0])
+
+
+def steps_to_metres(steps: np.ndarray, step_m: float) -> np.ndarray:
+    """Convert BFS hex steps to ``float32`` metres, mapping ``-1`` to NaN."""
+    dist = steps.astype(np.float32) * np.float32(step_m)
+    dist[steps < 0] = np.nan
     return dist
 
 
@@ -163,47 +359,60 @@ def add_distance_columns(
     Parameters
     ----------
     grid:
-        DataFrame with columns ``h3_id``, ``intersects_a``, and ``intersects_b``.
+        DataFrame with columns ``h3_id`` and ``flags``, as returned by
+        :func:`build_grid`. Boolean ``intersects_a`` and ``intersects_b``
+        columns are accepted in place of ``flags``.
 
     Returns
     -------
     DataFrame
-        A copy of the input grid with new columns ``dist_a`` and
-        ``dist_b`` containing distances in metres to the nearest
+        A copy of the input grid with new ``float32`` columns ``dist_a``
+        and ``dist_b`` containing distances in metres to the nearest
         polygon of each rock type.
+
+    Notes
+    -----
+    Distances depend only on the grid, not on the scoring parameters, so
+    they are cached in ``__cache__/`` keyed by a hash of the grid. Reruns
+    that only change ``falloff_km``, ``alpha`` or ``weight_a`` skip the
+    neighbour table and BFS entirely.
     """
-    # Copy to avoid mutating caller state
-    df = grid.copy()
+    # Shallow copy: new columns go on the copy, so the caller's frame is
+    # untouched without duplicating the existing column data
+    df = grid.copy(deep=False)
 
     # Check if grid is empty
     if df.empty:
         print("Warning: Grid is empty, returning empty DataFrame")
         return df
 
-    # Set H3 index for efficient lookups
-    df = df.set_index("h3_id", drop=False)
+    # Reuse distances computed by a previous run on the same grid
+    CACHE_DIR.mkdir(exist_ok=True)
+    cache_file = CACHE_DIR / f"dist_v1_{grid_digest(df)}.parquet"
+    if cache_file.exists():
+        cached = read_cache(cache_file, ["dist_a", "dist_b"])
+        df["dist_a"] = cached["dist_a"]
+        df["dist_b"] = cached["dist_b"]
+        return df
 
-    # Get sources for each rock type
-    sources_a = df.index[df["intersects_a"]].tolist()
-    sources_b = df.index[df["intersects_b"]].tolist()
-    grid_cells = set(df.index)
+    # Build the grid adjacency once for both rock types (rows follow df)
+    cells = pd.Index(df["h3_id"])
+    neighbours = hex_neighbour_table(cells)
 
     # Compute hex step distances using multi-source BFS
-    steps_a = hex_step_distances(sources_a, allowed_cells=grid_cells)
-    steps_b = hex_step_distances(sources_b, allowed_cells=grid_cells)
+    flags = packed_flags(df)
+    steps_a = hex_step_distances(neighbours, (flags & INTERSECTS_A) != 0)
+    steps_b = hex_step_distances(neighbours, (flags & INTERSECTS_B) != 0)
 
     # Convert hex steps to metres
-    res = h3.h3_get_resolution(df.index[0])
-    edge_m = h3.edge_length(res, "m")
-    step_m = edge_m * math.sqrt(3)  # centre-to-centre distance
-
-    # Attach distances to the DataFrame
-    df["dist_a"] = df.index.map(lambda h: steps_a.get(h, math.nan) * step_m)
-    df["dist_b"] = df.index.map(lambda h: steps_b.get(h, math.nan) * step_m)
+    step_m = STEP_M[grid_resolution(cells)]
 
-    # Reset index to match original structure
-    df = df.reset_index(drop=True)
+    # Attach distances to the DataFrame as float32 (sub-metre precision is
+    # plenty for scoring); unreached cells become NaN
+    df["dist_a"] = steps_to_metres(steps_a, step_m)
+    df["dist_b"] = steps_to_metres(steps_b, step_m)
 
+    write_cache(df[["dist_a", "dist_b"]], cache_file)
     return df
 
 
@@ -215,9 +424,11 @@ def h3_to_geodataframe(
     Parameters
     ----------
     df : pd.DataFrame
-        DataFrame containing H3 cell IDs
+        DataFrame containing H3 cell IDs, either ``uint64`` or hex strings
+        (as written to the GeoParquet output)
     h3_column : str
-        Name of column containing H3 cell IDs (default: "h3_id")
+        Name of column containing H3 cell IDs (default: "h3_id"). It is
+        converted to hex strings in the result, the form GIS tools expect
     target_crs : str, optional
         Target CRS to transform to. If None, uses settings.crs
 
@@ -225,27 +436,58 @@ def h3_to_geodataframe(
     -------
     gpd.GeoDataFrame
         GeoDataFrame with H3 polygons as geometry column
-    """
-    from shapely.geometry import Polygon
 
+    Notes
+    -----
+    Projected boundary vertices are cached in ``__cache__/`` keyed by a
+    hash of the cell ids and ``target_crs``, so reruns over the same grid
+    skip the per-cell boundary lookups and the reprojection.
+    """
     if target_crs is None:
         target_crs = settings.crs
 
-    # Create geometries from H3 IDs
-    geometries = []
-    for h3_id in df[h3_column]:
-        try:
-            boundary = h3.h3_to_geo_boundary(h3_id, geo_json=True)
-            poly = Polygon(boundary)
-            geometries.append(poly)
-        except Exception:
-            geometries.append(None)
-
-    # Create GeoDataFrame
-    gdf = gpd.GeoDataFrame(df, geometry=geometries, crs="EPSG:4326")
-
-    # Convert to target CRS
-    if target_crs != "EPSG:4326":
-        gdf = gdf.to_crs(target_crs)
+    # Validate once up front rather than catching errors per cell. Hex
+    # strings are converted to integers at this I/O edge.
+    ids = df[h3_column].tolist()
+    as_strings = df[h3_column].dtype == object
+    is_valid = h3.h3_is_valid if as_strings else h3_int.h3_is_valid
+    invalid = [h3_id for h3_id in ids if not is_valid(h3_id)]
+    if invalid:
+        raise ValueError(f"{len(invalid)} invalid H3 cell ids, e.g. {invalid[:3]}")
+    if as_strings:
+        ids = [h3.string_to_h3(h3_id) for h3_id in ids]
+
+    # Projected boundaries depend only on the cells and the CRS, so reruns
+    # over the same grid read them back instead of recomputing them
+    CACHE_DIR.mkdir(exist_ok=True)
+    h = hashlib.blake2b(str(target_crs).encode(), digest_size=8)
+    h.update(np.array(ids, dtype=np.uint64).tobytes())
+    cache_file = CACHE_DIR / f"bounds_{h.hexdigest()}.parquet"
+    if cache_file.exists():
+        cached = read_cache(cache_file, ["x", "y", "ring_start"])
+        coords = np.column_stack([cached["x"], cached["y"]])
+        starts = np.flatnonzero(cached["ring_start"])
+    else:
+        # Gather every boundary vertex and project them in one pyproj call
+        boundaries = [h3_int.h3_to_geo_boundary(h3_id, geo_json=True) for h3_id in ids]
+        counts = np.fromiter(map(len, boundaries), dtype=np.int64, count=len(boundaries))
+        coords = np.array(list(chain.from_iterable(boundaries)), dtype=np.float64).reshape(-1, 2)
+        if target_crs != "EPSG:4326":
+            transformer = Transformer.from_crs("EPSG:4326", target_crs, always_xy=True)
+            coords = np.column_stack(transformer.transform(coords[:, 0], coords[:, 1]))
+        starts = np.cumsum(counts) - counts
+        ring_start = np.zeros(len(coords), dtype=bool)
+        ring_start[starts] = True
+        write_cache(
+            pd.DataFrame({"x": coords[:, 0], "y": coords[:, 1], "ring_start": ring_start}),
+            cache_file,
+        )
+    rings = np.split(coords, starts[1:]) if len(starts) else []
+    geometries = [Polygon(ring) for ring in rings]
+
+    # Create GeoDataFrame (on a shallow copy, so the caller's frame doesn't
+    # gain a geometry column), with ids as strings only at this output edge
+    gdf = gpd.GeoDataFrame(df.copy(deep=False), geometry=geometries, crs=target_crs)
+    gdf[h3_column] = [h3.h3_to_string(h3_id) for h3_id in ids]
 
     return gdf
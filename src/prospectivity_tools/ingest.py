@@ -1,9 +1,57 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import geopandas as gpd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from .config import settings
 
+# Text columns searched for lithology keywords
+TEXT_COLUMNS = ["rock_type", "unit_desc", "strat_name"]
+
+# Lithology flag column -> keywords that set it
+LITHOLOGY_KEYWORDS = {
+    "is_ultramafic": ["ultramafic", "serpentinite"],
+    "is_granodiorite": ["granodiorite"],
+}
+
+
+def load_bedrock(path: str | Path) -> gpd.GeoDataFrame:
+    """Read bedrock polygons, skipping rows and columns the pipeline never uses.
+
+    When the configured rock types are lithology flags derived by
+    :func:`add_lithology_flags`, only the keyword text columns are read and
+    a ``LIKE`` filter on the keywords is pushed down to OGR, so polygons
+    that cannot match either rock type are never decoded.
+
+    Polygons are returned in the file's native CRS. They are only used to
+    index H3 cells, which reprojects them to WGS84 once if needed, so
+    projecting to the output CRS here would be a wasted PROJ pass.
+
+    Parameters
+    ----------
+    path : str or Path
+        Path to the bedrock geopackage.
+
+    Returns
+    -------
+    GeoDataFrame
+        Bedrock polygons in the CRS of the source file.
+    """
+    kwargs = {}
+    rock_types = [settings.rock_a, settings.rock_b]
+    if all(rock in LITHOLOGY_KEYWORDS for rock in rock_types):
+        keywords = [kw for rock in rock_types for kw in LITHOLOGY_KEYWORDS[rock]]
+        kwargs["columns"] = TEXT_COLUMNS
+        kwargs["where"] = " OR ".join(
+            f"{col} LIKE '%{kw}%'" for col in TEXT_COLUMNS for kw in keywords
+        )
+
+    return gpd.read_file(path, engine="pyogrio", **kwargs)
+
 
 def extract_rock_types(gdf: gpd.GeoDataFrame) -> tuple[gpd.GeoDataFrame, gpd.GeoDataFrame]:
     """Filter the input GeoDataFrame by rock type columns.
@@ -63,19 +111,20 @@ def add_lithology_flags(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     Returns
     -------
     GeoDataFrame
-        GeoDataFrame with added columns: is_ultramafic, is_granodiorite
+        GeoDataFrame with added ``int8`` columns: is_ultramafic, is_granodiorite
 
     """
-    # Build a lowercase text blob for keyword searches
-    text_cols = ["rock_type", "unit_desc", "strat_name"]
-    gdf["_search"] = gdf[text_cols].fillna("").agg(" | ".join, axis=1).str.lower()
-
-    # Binary indicators for target lithologies
-    gdf["is_ultramafic"] = gdf["_search"].str.contains("ultramafic|serpentinite").astype(int)
-
-    gdf["is_granodiorite"] = gdf["_search"].str.contains("granodiorite").astype(int)
-
-    # Remove the temporary search column
-    gdf = gdf.drop(columns=["_search"])
+    # Match each text column with Arrow's compiled string kernels and OR
+    # the results, rather than joining the columns into a lowercase blob row
+    # by row in Python. Keywords can't span the columns, so this is the
+    # same as searching the joined text; missing text never matches.
+    columns = [pa.array(gdf[col], type=pa.large_string(), from_pandas=True) for col in TEXT_COLUMNS]
+    for flag, keywords in LITHOLOGY_KEYWORDS.items():
+        pattern = "|".join(keywords)
+        matches = [pc.match_substring_regex(col, pattern, ignore_case=True) for col in columns]
+        found = matches[0]
+        for match in matches[1:]:
+            found = pc.or_kleene(found, match)
+        gdf[flag] = pc.fill_null(found, False).to_numpy(zero_copy_only=False).astype(np.int8)
 
     return gdf
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import geopandas as gpd
+
+# Rows per Parquet row group. Small enough that readers filtering on a
+# subset of the grid can skip whole groups, large enough to compress well.
+ROW_GROUP_SIZE = 65_536
+
+
+def write_parquet(gdf: gpd.GeoDataFrame, path: str | Path) -> Path:
+    """Write a GeoDataFrame to GeoParquet.
+
+    The file is written column-wise with zstd compression in fixed-size
+    row groups, which is far faster to write and read back than a
+    row-by-row GeoPackage. If an ``h3_id`` column is present, rows are
+    sorted by it first: H3 ids share their leading digits with their
+    parent cells, so the sort clusters neighbouring cells together, which
+    compresses better and gives each row group a compact extent.
+
+    Parameters
+    ----------
+    gdf : gpd.GeoDataFrame
+        GeoDataFrame to write.
+    path : str or Path
+        Destination file. Parent directories are created if needed.
+
+    Returns
+    -------
+    Path
+        The path that was written.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if "h3_id" in gdf.columns:
+        gdf = gdf.sort_values("h3_id")
+    gdf.to_parquet(
+        path,
+        index=False,
+        compression="zstd",
+        compression_level=9,
+        row_group_size=ROW_GROUP_SIZE,
+    )
+    return path
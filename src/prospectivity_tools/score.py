@@ -2,6 +2,24 @@ import numpy as np
 import pandas as pd
 
 from .config import settings
+from .flags import INTERSECTS_A, INTERSECTS_B, packed_flags
+
+
+def _power(x: np.ndarray, p: float) -> np.ndarray:
+    """Return ``x ** p``, avoiding the general ``pow`` for common exponents.
+
+    ``pow`` evaluates a log and an exp per element; squares, square roots
+    and the identity are much cheaper. May return ``x`` itself for ``p == 1``.
+    """
+    if p == 1.0:
+        return x
+    if p == 2.0:
+        return x * x
+    if p == 0.5:
+        return np.sqrt(x)
+    if p == 0.0:
+        return np.ones_like(x)  # x**0 is 1 even for NaN
+    return np.power(x, p)
 
 
 def gaussian(d: np.ndarray, d0_m: float, alpha: float = 2.0) -> np.ndarray:
@@ -24,7 +42,14 @@ def gaussian(d: np.ndarray, d0_m: float, alpha: float = 2.0) -> np.ndarray:
     numpy.ndarray
         Array of scores between 0 and 1.
     """
-    return np.exp(-((d / d0_m) ** alpha))
+    # Scaling by the reciprocal multiplies instead of dividing per element.
+    # The product is a fresh array, so the remaining passes reuse it rather
+    # than each allocating another temporary.
+    x = _power(d * (1.0 / d0_m), alpha)
+    if not isinstance(x, np.ndarray):
+        return np.exp(-x)  # scalar input; there is no buffer to reuse
+    np.negative(x, out=x)
+    return np.exp(x, out=x)
 
 
 def weighted_and(mu_a: np.ndarray, mu_b: np.ndarray, w_a: float) -> np.ndarray:
@@ -45,7 +70,58 @@ def weighted_and(mu_a: np.ndarray, mu_b: np.ndarray, w_a: float) -> np.ndarray:
     """
     w_a = float(np.clip(w_a, 0.0, 1.0))
     w_b = 1.0 - w_a
-    return (mu_a**w_a) * (mu_b**w_b)
+    return _power(mu_a, w_a) * _power(mu_b, w_b)
+
+
+def gaussian_weighted_and(
+    d_a: np.ndarray, d_b: np.ndarray, d0_m: float, alpha: float = 2.0, w_a: float = 0.5
+) -> np.ndarray:
+    """
+    Weighted AND of the Gaussian memberships of two distance arrays.
+
+    Equivalent to ``weighted_and(gaussian(d_a, d0_m, alpha),
+    gaussian(d_b, d0_m, alpha), w_a)``, but since a weighted product of
+    exponentials is the exponential of a weighted sum, it is computed as
+    exp(-(w_a*(d_a/d0)^alpha + w_b*(d_b/d0)^alpha)): a single exp over one
+    accumulator instead of two memberships, two powers and a product.
+
+    Cells with a NaN or infinite distance to a rock type that carries
+    weight (i.e. never reached by the distance search) score 0, the limit
+    of the kernel as distance grows, rather than NaN.
+
+    Parameters
+    ----------
+    d_a, d_b : numpy.ndarray
+        Distances in metres to rock types A and B.
+    d0_m : float
+        Fall-off distance in metres.
+    alpha : float
+        Shape factor controlling the steepness of the fall-off.
+    w_a : float
+        Relative importance of rock type A.
+
+    Returns
+    -------
+    numpy.ndarray
+        Combined membership (0–1).
+    """
+    w_a = float(np.clip(w_a, 0.0, 1.0))
+    inv_d0 = 1.0 / d0_m  # multiply by the reciprocal rather than divide per element
+    exponent = np.zeros(np.shape(d_a), dtype=np.result_type(d_a, d_b, np.float32))
+    for d, w in [(d_a, w_a), (d_b, 1.0 - w_a)]:
+        # A zero-weight rock type drops out entirely, as mu**0 == 1 does in
+        # weighted_and, even where its distance is NaN or infinite
+        if w > 0:
+            term = _power(d * inv_d0, alpha)  # a fresh array, safe to scale in place
+            term *= w
+            exponent += term
+    np.negative(exponent, out=exponent)
+    score = np.exp(exponent, out=exponent)
+
+    # Unreached cells come out of pow/exp as NaN; zeroing them afterwards is
+    # cheaper than gathering the reachable cells and scattering results back
+    score[np.isnan(score)] = 0.0
+    return score
 
 
 def compute_likelihood(df: pd.DataFrame) -> pd.DataFrame:
@@ -55,24 +131,36 @@ def compute_likelihood(df: pd.DataFrame) -> pd.DataFrame:
     Parameters
     ----------
     df : pandas.DataFrame
-        DataFrame containing columns `h3_id`, `dist_a`, `dist_b`,
-        `intersects_a`, and `intersects_b`.
+        DataFrame containing columns `h3_id`, `flags`, `dist_a`, and
+        `dist_b`. Boolean `intersects_a` and `intersects_b` columns are
+        accepted in place of `flags`.
 
     Returns
     -------
     pandas.DataFrame
-        DataFrame with columns `h3_id`, `score`, `intersects_a`, and `intersects_b`.
+        DataFrame with columns `h3_id`, `score` (``float32``), and boolean
+        `intersects_a` and `intersects_b` unpacked from `flags`.
     """
     d0_m = settings.falloff_km * 1_000
 
-    # Convert distances to fuzzy memberships
-    mu_a = gaussian(df["dist_a"].to_numpy(), d0_m, settings.alpha)
-    mu_b = gaussian(df["dist_b"].to_numpy(), d0_m, settings.alpha)
-
-    # Combine with weighted AND
-    score = weighted_and(mu_a, mu_b, settings.weight_a)
-
-    # Package result
-    out = df[["h3_id", "intersects_a", "intersects_b"]].copy()
-    out["score"] = score
-    return out
+    # Convert distances to fuzzy memberships and combine with weighted AND.
+    # float32 is ample for scores in [0, 1] and halves the memory traffic
+    # of the pow/exp passes, so the score column is float32 too.
+    score = gaussian_weighted_and(
+        df["dist_a"].to_numpy(dtype=np.float32),
+        df["dist_b"].to_numpy(dtype=np.float32),
+        d0_m,
+        settings.alpha,
+        settings.weight_a,
+    )
+
+    # Package result. h3_id shares its buffer with ``df`` instead of being
+    # copied; the intersection flags are unpacked for output consumers.
+    flags = packed_flags(df)
+    columns = {
+        "h3_id": df["h3_id"].to_numpy(),
+        "intersects_a": (flags & INTERSECTS_A) != 0,
+        "intersects_b": (flags & INTERSECTS_B) != 0,
+        "score": score,
+    }
+    return pd.DataFrame(columns, index=df.index, copy=False)
@@ -1,3 +1,7 @@
+import numpy as np
+import pandas as pd
+
+
 def df_more_info(dataframe):
     """
     Generate a detailed description of the columns in a DataFrame.
@@ -10,29 +14,49 @@ def df_more_info(dataframe):
     """
     output = []
 
+    # Compute the per-column statistics up front in a few frame-wide passes,
+    # rather than re-scanning each column for every statistic. (Missing
+    # values are the exception: a frame-wide isna() over object columns is
+    # slower than one isna() per column.)
+    object_cols = [col for col in dataframe.columns if dataframe[col].dtype == "object"]
+    nunique = dataframe[object_cols].nunique()
+    numeric_cols = [
+        col
+        for col in dataframe.columns
+        if dataframe[col].dtype in ["int64", "float64", "float32", "int32"]
+    ]
+    # agg() raises on a frame without columns, so skip it when there are none
+    stats = dataframe[numeric_cols].agg(["min", "max", "mean"]) if numeric_cols else pd.DataFrame()
+    rng = np.random.default_rng(42)
+
     for col in dataframe.columns:
         output.append(f"Column: {col}")
-        output.append(
-            f"  Missing: {dataframe[col].isnull().sum()} ({dataframe[col].isnull().mean():.1%})"
-        )
-        if dataframe[col].dtype == "object":
+        missing = dataframe[col].isna()
+        output.append(f"  Missing: {missing.sum()} ({missing.mean():.1%})")
+        if col in nunique:
             # if fewer than 5 unique values, describe them as a count of each value
-            if dataframe[col].nunique() <= 5:
+            if nunique[col] <= 5:
                 value_counts = dataframe[col].value_counts()
                 output.append(f"  Value counts:\n{value_counts}\n")
             else:
-                output.append(f"  Unique values: {dataframe[col].nunique()}")
-                # 10 random examples, each on their own indented line
-                examples = dataframe[col].sample(10, random_state=42).tolist()
+                output.append(f"  Unique values: {nunique[col]}")
+                # 10 random examples, each on their own indented line. Drawing
+                # row positions costs O(10), where Series.sample shuffles the
+                # whole column.
+                rows = rng.choice(len(dataframe), size=min(10, len(dataframe)), replace=False)
+                examples = dataframe[col].iloc[rows].tolist()
                 output.append("  Examples:")
                 for example in examples:
                     output.append(f"    - {example}")
 
-        elif dataframe[col].dtype in ["int64", "float64", "float32", "int32"]:
-            output.append(
-                f"  Min: {dataframe[col].min()}, Max: {dataframe[col].max()}, "
-                f"  Mean: {dataframe[col].mean()}"
+        elif col in stats:
+            # Stats share one frame, so cast min/max back to the column's type
+            # (except NaN, the min/max of an empty or all-missing column)
+            lo, hi = (
+                value if pd.isna(value) else dataframe[col].dtype.type(value)
+                for value in (stats.at["min", col], stats.at["max", col])
             )
+            output.append(f"  Min: {lo}, Max: {hi},   Mean: {stats.at['mean', col]}")
         else:
             output.append(f"  Data type: {dataframe[col].dtype}")
         output.append("\n")
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import contextily as ctx
 import geopandas as gpd
 import matplotlib as mpl
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import PolyCollection
+from pyproj import Transformer
 
 from .config import settings
 
@@ -39,16 +44,41 @@ def build_static_map(gdf: gpd.GeoDataFrame, output_path: str | None = None) -> p
     ax.set_title("Cobalt Prospectivity Map", fontsize=16, fontweight="bold")
 
     cmap = mpl.colors.LinearSegmentedColormap.from_list("prospectivity", ["green", "yellow", "red"])
-    norm = plt.Normalize(vmin=gdf["score"].min(), vmax=gdf["score"].max())
-    facecolours = [(*cmap(norm(s))[:3], norm(s)) for s in gdf["score"]]
-
-    gdf.plot(ax=ax, color=facecolours, edgecolor="none", linewidth=0)
-
-    # Set tight bounds to data extent
-    ax.set_xlim(gdf.total_bounds[0], gdf.total_bounds[2])
-    ax.set_ylim(gdf.total_bounds[1], gdf.total_bounds[3])
+    scores = gdf["score"].to_numpy()
+    norm = plt.Normalize(vmin=np.nanmin(scores), vmax=np.nanmax(scores))
+
+    # Alpha is the normalised score; cells whose alpha rounds to 0 in the
+    # 8-bit image leave no trace, so drop them before building their patches
+    alpha = np.asarray(norm(scores))
+    visible = alpha * 255 >= 0.5
+
+    # One colormap call over the whole array gives an (N, 4) RGBA array
+    facecolours = cmap(alpha[visible])
+    facecolours[:, 3] = alpha[visible]
+
+    # Draw all cells as one PolyCollection artist; gdf.plot builds a patch
+    # per polygon. H3 cells have no holes, so exteriors are enough. The
+    # cells are rasterized so vector outputs (PDF/SVG) embed one image
+    # instead of a path per cell; text and axes stay vector.
+    rings = [np.asarray(geom.exterior.coords) for geom in gdf.geometry[visible]]
+    ax.add_collection(
+        PolyCollection(
+            rings, facecolors=facecolours, edgecolors="none", linewidths=0, rasterized=True
+        )
+    )
+    ax.set_aspect("equal")
 
-    # Add basemap
+    # Set tight bounds to data extent. total_bounds visits every geometry,
+    # so it is computed once and reused for the scale bar and labels.
+    xmin, ymin, xmax, ymax = gdf.total_bounds
+    ax.set_xlim(xmin, xmax)
+    ax.set_ylim(ymin, ymax)
+
+    # Add basemap. contextily only caches tiles for the current session by
+    # default; a persistent cache directory lets reruns skip the downloads.
+    tile_cache = Path(settings.paths.get("tile_cache", "__cache__/tiles"))
+    tile_cache.mkdir(parents=True, exist_ok=True)
+    ctx.set_cache_dir(str(tile_cache))
     ctx.add_basemap(
         ax,
         crs=gdf.crs,
@@ -63,7 +93,6 @@ def build_static_map(gdf: gpd.GeoDataFrame, output_path: str | None = None) -> p
     cbar.set_label("Prospectivity score", rotation=270, labelpad=20)
 
     # 50-km scale bar
-    xmin, ymin, xmax, ymax = gdf.total_bounds
     scalelen = 50_000
     sx = xmin + 0.05 * (xmax - xmin)
     sy = ymin + 0.05 * (ymax - ymin)
@@ -78,9 +107,11 @@ def build_static_map(gdf: gpd.GeoDataFrame, output_path: str | None = None) -> p
         weight="bold",
     )
 
-    # Add coordinate labels (convert back to lat/lng for display)
-    gdf_latlon = gdf.to_crs("EPSG:4326")
-    lon_min, lat_min, lon_max, lat_max = gdf_latlon.total_bounds
+    # Add coordinate labels (convert back to lat/lng for display). Web
+    # Mercator maps x to longitude and y to latitude independently, so the
+    # projected corners give the exact geographic bounds.
+    to_latlon = Transformer.from_crs(gdf.crs, "EPSG:4326", always_xy=True)
+    (lon_min, lon_max), (lat_min, lat_max) = to_latlon.transform([xmin, xmax], [ymin, ymax])
 
     # X-axis (longitude) labels - 5 evenly spaced
     lon_ticks = [lon_min + i * (lon_max - lon_min) / 4 for i in range(5)]
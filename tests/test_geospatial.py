@@ -0,0 +1,153 @@
+"""Basic unit tests for the H3 grid and distance functions."""
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+from h3.api import basic_int as h3_int
+from shapely.geometry import Point, box
+
+from prospectivity_tools import geospatial
+from prospectivity_tools.config import settings
+from prospectivity_tools.flags import INTERSECTS_A, INTERSECTS_B
+from prospectivity_tools.geospatial import (
+    add_distance_columns,
+    build_grid,
+    grid_resolution,
+    h3_to_geodataframe,
+    hex_neighbour_table,
+    hex_step_distances,
+    polyfill_work,
+    subdivide_polygon,
+    to_wgs84,
+)
+
+CENTRE = h3_int.geo_to_h3(50.0, -122.0, 8)
+
+
+def test_hex_step_distances_matches_grid_distance():
+    """Test that BFS steps equal the H3 grid distance from a single source."""
+    cells = pd.Index(np.array(sorted(h3_int.k_ring(CENTRE, 3)), dtype=np.uint64))
+    neighbours = hex_neighbour_table(cells)
+    steps = hex_step_distances(neighbours, np.asarray(cells == CENTRE))
+    expected = [h3_int.h3_distance(CENTRE, h) for h in cells]
+    assert steps.tolist() == expected
+
+
+def test_hex_neighbour_table_across_base_cells():
+    """Test that neighbours match k_ring where the grid spans two base cells."""
+    centre = h3_int.geo_to_h3(49.3, -120.0, 8)
+    cells = pd.Index(np.array(sorted(h3_int.k_ring(centre, 4)), dtype=np.uint64))
+    assert len({h3_int.h3_get_base_cell(h) for h in cells}) == 2
+    table = hex_neighbour_table(cells)
+    for h, row in zip(cells, table, strict=True):
+        expected = {nb for nb in h3_int.k_ring(h, 1) if nb != h and nb in cells}
+        assert {cells[i] for i in row if i >= 0} == expected
+
+
+def test_hex_step_distances_unreachable():
+    """Test that cells disconnected from every source are marked -1."""
+    far = h3_int.geo_to_h3(55.0, -125.0, 8)
+    cells = pd.Index(np.array([CENTRE, far], dtype=np.uint64))
+    neighbours = hex_neighbour_table(cells)
+    steps = hex_step_distances(neighbours, np.array([True, False]))
+    assert steps.tolist() == [0, -1]
+
+
+def test_grid_resolution_rejects_mixed_resolutions():
+    """Test that the resolution is read from the ids and must be shared."""
+    parent = h3_int.h3_to_parent(CENTRE, 7)
+    assert grid_resolution(pd.Index(np.array([CENTRE], dtype=np.uint64))) == 8
+    with pytest.raises(ValueError):
+        grid_resolution(pd.Index(np.array([CENTRE, parent], dtype=np.uint64)))
+
+
+def test_build_grid_uses_in_memory_resolution(tmp_path, monkeypatch):
+    """Test that the grid and both polyfills use the caller's current resolution."""
+    monkeypatch.setattr(geospatial, "CACHE_DIR", tmp_path)
+    monkeypatch.setitem(settings.grid, "resolution", settings.grid["resolution"] - 1)
+    rock_a = gpd.GeoDataFrame(geometry=[box(-122.10, 50.0, -122.05, 50.05)], crs="EPSG:4326")
+    rock_b = gpd.GeoDataFrame(geometry=[box(-122.00, 50.0, -121.95, 50.05)], crs="EPSG:4326")
+
+    grid = build_grid(rock_a, rock_b)
+    flags = grid["flags"].to_numpy()
+    assert ((flags & INTERSECTS_A) != 0).sum() == len(geospatial.polys_to_h3(rock_a, "a"))
+    assert ((flags & INTERSECTS_B) != 0).sum() == len(geospatial.polys_to_h3(rock_b, "b"))
+    assert grid_resolution(pd.Index(grid["h3_id"])) == settings.grid["resolution"]
+
+
+def test_h3_to_geodataframe_reads_hex_string_ids(tmp_path, monkeypatch):
+    """Test that the hex-string ids it writes out are accepted back."""
+    monkeypatch.setattr(geospatial, "CACHE_DIR", tmp_path)
+    cells = np.array(sorted(h3_int.k_ring(CENTRE, 1)), dtype=np.uint64)
+    gdf = h3_to_geodataframe(pd.DataFrame({"h3_id": cells}))
+    again = h3_to_geodataframe(pd.DataFrame(gdf.drop(columns="geometry")))
+    assert again["h3_id"].tolist() == gdf["h3_id"].tolist()
+    assert again.geometry.geom_equals_exact(gdf.geometry, 0).all()
+    with pytest.raises(ValueError):
+        h3_to_geodataframe(pd.DataFrame({"h3_id": ["not-a-cell"]}))
+
+
+def _polyfill_rings(polys, res):
+    """Return the set of cells polyfilling each polygon's exterior ring."""
+    cells = set()
+    for poly in polys:
+        geojson = {"type": "Polygon", "coordinates": [list(poly.exterior.coords)]}
+        cells.update(h3_int.polyfill_geojson(geojson, res))
+    return cells
+
+
+def test_subdivided_polygon_polyfills_to_same_cells():
+    """Test that polyfilling the pieces of a split polygon gives the same cells."""
+    poly = Point(-122.0, 50.0).buffer(0.1, resolution=64)
+    max_work = polyfill_work(poly, 8) / 10
+    pieces = subdivide_polygon(poly, 8, max_work)
+    assert len(pieces) > 1
+    assert all(polyfill_work(piece, 8) <= max_work for piece in pieces)
+    assert _polyfill_rings(pieces, 8) == _polyfill_rings([poly], 8)
+
+
+def test_h3_to_geodataframe_boundary_cache(tmp_path, monkeypatch):
+    """Test that warm (cached) and cold boundary geometries are equal."""
+    monkeypatch.setattr(geospatial, "CACHE_DIR", tmp_path)
+    df = pd.DataFrame({"h3_id": np.array(sorted(h3_int.k_ring(CENTRE, 2)), dtype=np.uint64)})
+    cold = h3_to_geodataframe(df)
+    assert len(list(tmp_path.glob("bounds_*.parquet"))) == 1
+
+    def no_lookups(*args, **kwargs):
+        raise AssertionError("boundary looked up on a cache hit")
+
+    monkeypatch.setattr(geospatial.h3_int, "h3_to_geo_boundary", no_lookups)
+    warm = h3_to_geodataframe(df)
+    assert warm.geometry.geom_equals_exact(cold.geometry, 0).all()
+    with pytest.raises(AssertionError):
+        h3_to_geodataframe(df, target_crs="EPSG:4326")  # a new CRS is a miss
+
+
+def test_to_wgs84_shifts_other_geographic_datums():
+    """Test that only WGS84 passes through; NAD27 lon/lat gets its datum shift."""
+    wgs84 = gpd.GeoDataFrame(geometry=[Point(-122.0, 50.0)], crs="EPSG:4326")
+    assert to_wgs84(wgs84) is wgs84
+    nad27 = gpd.GeoDataFrame(geometry=[Point(-122.0, 50.0)], crs="EPSG:4267")
+    shifted = to_wgs84(nad27)
+    assert shifted.crs.equals("EPSG:4326")
+    assert shifted.geometry.iloc[0].distance(Point(-122.0, 50.0)) > 1e-4
+
+
+def test_add_distance_columns_cache(tmp_path, monkeypatch):
+    """Test that warm (cached) and cold distances are equal and flags key the cache."""
+    monkeypatch.setattr(geospatial, "CACHE_DIR", tmp_path)
+    cells = np.array(sorted(h3_int.k_ring(CENTRE, 3)), dtype=np.uint64)
+    flags = np.where(cells == CENTRE, INTERSECTS_A | INTERSECTS_B, 0).astype(np.uint8)
+    grid = pd.DataFrame({"h3_id": cells, "flags": flags})
+    cold = add_distance_columns(grid)
+    assert len(list(tmp_path.glob("dist_v1_*.parquet"))) == 1
+
+    def no_search(*args, **kwargs):
+        raise AssertionError("distances recomputed on a cache hit")
+
+    monkeypatch.setattr(geospatial, "hex_step_distances", no_search)
+    warm = add_distance_columns(grid)
+    assert warm[["dist_a", "dist_b"]].equals(cold[["dist_a", "dist_b"]])
+    with pytest.raises(AssertionError):
+        add_distance_columns(grid.assign(flags=flags ^ INTERSECTS_B))  # new flags miss
@@ -0,0 +1,66 @@
+"""Basic unit tests for the ingest functions."""
+
+import geopandas as gpd
+import numpy as np
+import pytest
+from shapely.geometry import box
+
+from prospectivity_tools import ingest
+from prospectivity_tools.ingest import add_lithology_flags, load_bedrock
+
+
+def _bedrock() -> gpd.GeoDataFrame:
+    """Small bedrock fixture with mixed case, missing text and split keywords."""
+    return gpd.GeoDataFrame(
+        {
+            "rock_type": ["Ultramafic rocks", None, "granite", np.nan, "GRANODIORITE", "basalt"],
+            "unit_desc": ["", "Serpentinite lens", None, "quartz granodiorite", None, np.nan],
+            "strat_name": [None, np.nan, "Coast Plutonic", "", "Ultramafic belt", None],
+        },
+        geometry=[box(i, 0, i + 1, 1) for i in range(6)],
+        crs="EPSG:4326",
+    )
+
+
+def _joined_text_flags(gdf: gpd.GeoDataFrame) -> dict[str, list[int]]:
+    """Flags as computed by searching the lowercased, joined text columns."""
+    text = gdf[ingest.TEXT_COLUMNS].fillna("").agg(" | ".join, axis=1).str.lower()
+    return {
+        flag: text.str.contains("|".join(keywords)).astype(int).tolist()
+        for flag, keywords in ingest.LITHOLOGY_KEYWORDS.items()
+    }
+
+
+def test_add_lithology_flags_matches_joined_text_search():
+    """Test that per-column matching equals a search of the joined text."""
+    expected = _joined_text_flags(_bedrock())
+    result = add_lithology_flags(_bedrock())
+    for flag, values in expected.items():
+        assert result[flag].dtype == np.int8
+        assert result[flag].tolist() == values
+
+
+def test_load_bedrock_pushes_keyword_filter_down(monkeypatch):
+    """Test that only keyword text columns and LIKE-filtered rows are requested."""
+    calls = {}
+    monkeypatch.setattr(ingest.gpd, "read_file", lambda path, **kwargs: calls.update(kwargs))
+    load_bedrock("bedrock.gpkg")
+    assert calls["engine"] == "pyogrio"
+    assert calls["columns"] == ingest.TEXT_COLUMNS
+    for col in ingest.TEXT_COLUMNS:
+        assert f"{col} LIKE '%granodiorite%'" in calls["where"]
+
+
+def test_load_bedrock_filter_keeps_every_match(tmp_path):
+    """Test that the pushed-down filter keeps every row the flags would select."""
+    pytest.importorskip("pyogrio")
+    path = tmp_path / "bedrock.gpkg"
+    bedrock = _bedrock()
+    bedrock.to_file(path, driver="GPKG")
+
+    loaded = add_lithology_flags(load_bedrock(path))
+    expected = _joined_text_flags(bedrock)
+    keep = [any(values) for values in zip(*expected.values(), strict=True)]
+    assert len(loaded) == sum(keep)
+    for flag, values in expected.items():
+        assert loaded[flag].tolist() == [v for v, k in zip(values, keep, strict=True) if k]
@@ -0,0 +1,37 @@
+"""Basic unit tests for the output writers."""
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from h3.api import basic_int as h3_int
+
+from prospectivity_tools import geospatial, persist
+from prospectivity_tools.geospatial import h3_to_geodataframe
+from prospectivity_tools.persist import write_parquet
+
+
+def test_write_parquet_round_trip(tmp_path, monkeypatch):
+    """Test rows come back sorted by h3_id with CRS, geometry and layout intact."""
+    monkeypatch.setattr(geospatial, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(persist, "ROW_GROUP_SIZE", 2)
+    centre = h3_int.geo_to_h3(50.0, -122.0, 8)
+    cells = np.array(sorted(h3_int.k_ring(centre, 1), reverse=True)[:5], dtype=np.uint64)
+    gdf = h3_to_geodataframe(pd.DataFrame({"h3_id": cells, "score": np.arange(5.0)}))
+
+    path = write_parquet(gdf, tmp_path / "nested" / "dir" / "scores.parquet")
+    result = gpd.read_parquet(path)
+
+    expected = gdf.sort_values("h3_id").reset_index(drop=True)
+    assert result["h3_id"].tolist() == sorted(gdf["h3_id"])
+    assert result["score"].tolist() == expected["score"].tolist()
+    assert result.crs.equals(gdf.crs)
+    assert result.geometry.geom_equals_exact(expected.geometry, 0).all()
+
+    metadata = pq.ParquetFile(path).metadata
+    assert metadata.num_row_groups == 3
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        assert row_group.num_rows <= 2
+        for j in range(row_group.num_columns):
+            assert row_group.column(j).compression == "ZSTD"
@@ -1,9 +1,18 @@
 """Basic unit tests for the scoring functions."""
 
+import subprocess
+import sys
+
 import numpy as np
 import pandas as pd
 
-from prospectivity_tools.score import compute_likelihood, gaussian, weighted_and
+from prospectivity_tools.flags import INTERSECTS_A, INTERSECTS_B
+from prospectivity_tools.score import (
+    compute_likelihood,
+    gaussian,
+    gaussian_weighted_and,
+    weighted_and,
+)
 
 
 def test_gaussian_at_zero_distance():
@@ -14,6 +23,13 @@ def test_gaussian_at_zero_distance():
     assert np.isclose(result[0], 1.0)
 
 
+def test_gaussian_scalar_distance():
+    """Test that gaussian accepts scalar distances as well as arrays."""
+    expected = np.exp(-0.25)
+    assert np.isclose(gaussian(500.0, 1000.0), expected)
+    assert np.isclose(gaussian(np.float64(500.0), 1000.0), expected)
+
+
 def test_weighted_and_equal_weights():
     """Test weighted_and with equal weights."""
     mu_a = np.array([0.8])
@@ -24,17 +40,61 @@ def test_weighted_and_equal_weights():
     assert np.isclose(result[0], expected)
 
 
+def test_gaussian_weighted_and_matches_composition():
+    """Test that the fused score equals weighted_and of two gaussians."""
+    d_a = np.array([0.0, 500.0, 2000.0, np.nan])
+    d_b = np.array([300.0, 0.0, 5000.0, 100.0])
+    for alpha in [0.75, 1.0, 2.0]:
+        for w_a in [0.0, 0.3, 0.5, 1.0]:
+            mu_a = np.exp(-((d_a / 1000.0) ** alpha))
+            mu_b = np.exp(-((d_b / 1000.0) ** alpha))
+            expected = (mu_a**w_a) * (mu_b ** (1.0 - w_a))
+            assert np.allclose(gaussian(d_a, 1000.0, alpha), mu_a, equal_nan=True)
+            assert np.allclose(weighted_and(mu_a, mu_b, w_a), expected, equal_nan=True)
+            # Unreached cells (NaN distance to a weighted rock type) score 0
+            result = gaussian_weighted_and(d_a, d_b, 1000.0, alpha, w_a)
+            assert np.allclose(result, np.nan_to_num(expected, nan=0.0))
+
+
 def test_compute_likelihood_structure():
     """Test that compute_likelihood returns the correct structure."""
     df = pd.DataFrame(
         {
             "h3_id": ["test_cell"],
+            "flags": np.array([INTERSECTS_A | INTERSECTS_B], dtype=np.uint8),
             "dist_a": [0.0],
             "dist_b": [0.0],
-            "intersects_a": [True],
-            "intersects_b": [True],
         }
     )
     result = compute_likelihood(df)
     expected_columns = ["h3_id", "intersects_a", "intersects_b", "score"]
     assert list(result.columns) == expected_columns
+    assert result["score"].dtype == np.float32
+    assert result["intersects_a"].tolist() == [True]
+    assert result["intersects_b"].tolist() == [True]
+
+
+def test_score_does_not_import_geospatial_stack():
+    """Test that the numpy-only scoring module doesn't pull in geopandas."""
+    code = "import sys, prospectivity_tools.score; assert 'geopandas' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_compute_likelihood_accepts_boolean_intersection_columns():
+    """Test that grids in the older boolean-column schema still score."""
+    df = pd.DataFrame(
+        {
+            "h3_id": ["a", "b"],
+            "dist_a": [0.0, 500.0],
+            "dist_b": [0.0, 0.0],
+            "intersects_a": [True, False],
+            "intersects_b": [True, True],
+        }
+    )
+    packed = df.drop(columns=["intersects_a", "intersects_b"]).assign(
+        flags=np.array([INTERSECTS_A | INTERSECTS_B, INTERSECTS_B], dtype=np.uint8)
+    )
+    result = compute_likelihood(df)
+    assert result["intersects_a"].tolist() == [True, False]
+    assert result["intersects_b"].tolist() == [True, True]
+    assert result.equals(compute_likelihood(packed))
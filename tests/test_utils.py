@@ -0,0 +1,28 @@
+"""Basic unit tests for the utility functions."""
+
+import numpy as np
+import pandas as pd
+
+from prospectivity_tools.utils import df_more_info
+
+
+def test_df_more_info_without_summarised_numeric_columns():
+    """Test frames with only strings or only int8 flags are described."""
+    text = pd.DataFrame({"rock_type": ["granite", "basalt", None]})
+    flags = pd.DataFrame({"is_ultramafic": np.array([0, 1, 1], dtype=np.int8)})
+    assert "Value counts" in df_more_info(text)
+    assert "Data type: int8" in df_more_info(flags)
+
+
+def test_df_more_info_empty_numeric_column():
+    """Test that an empty int column reports NaN min/max, not a cast NaN."""
+    df = pd.DataFrame({"count": pd.Series([], dtype="int64")})
+    assert "Min: nan, Max: nan" in df_more_info(df)
+
+
+def test_df_more_info_keeps_column_types():
+    """Test that min/max keep the column's own type alongside float columns."""
+    df = pd.DataFrame({"count": [3, 1, 2], "ratio": [0.5, 0.25, np.nan]})
+    info = df_more_info(df)
+    assert "Min: 1, Max: 3" in info
+    assert "Min: 0.25, Max: 0.5" in info